@@ -0,0 +1,51 @@
+"""
+Fast paragraph text extraction for .docx files.
+
+Reads word/document.xml straight out of the zip archive with lxml instead of
+building a python-docx Paragraph object per paragraph, and falls back to
+python-docx when a file is not laid out as expected.
+"""
+
+import zipfile
+
+from lxml import etree
+
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_W_BODY = f"{{{_W_NS}}}body"
+_W_P = f"{{{_W_NS}}}p"
+_W_T = f"{{{_W_NS}}}t"
+_W_BR = f"{{{_W_NS}}}br"
+_W_TYPE = f"{{{_W_NS}}}type"
+
+# Text for run children that python-docx's Paragraph.text renders as fixed
+# characters; a w:br only counts as a line break when it has no other type
+_RUN_CHARS = {
+    f"{{{_W_NS}}}tab": "\t",
+    f"{{{_W_NS}}}ptab": "\t",
+    f"{{{_W_NS}}}cr": "\n",
+    f"{{{_W_NS}}}noBreakHyphen": "-",
+}
+
+# Children of a paragraph's own runs (including those inside hyperlinks) in
+# document order, the same content python-docx's Paragraph.text reads
+_RUN_CHILDREN = etree.XPath("(w:r | w:hyperlink/w:r)/*", namespaces={"w": _W_NS})
+
+def _run_child_text(node) -> str:
+    if node.tag == _W_T:
+        return node.text or ""
+    if node.tag == _W_BR:
+        return "\n" if node.get(_W_TYPE, "textWrapping") == "textWrapping" else ""
+    return _RUN_CHARS.get(node.tag, "")
+
+def docx_paragraphs(path) -> list[str]:
+    """Return the text of each body paragraph, like [p.text for p in Document(path).paragraphs]."""
+    try:
+        with zipfile.ZipFile(path) as archive:
+            root = etree.fromstring(archive.read("word/document.xml"))
+        return [
+            "".join(_run_child_text(node) for node in _RUN_CHILDREN(p))
+            for p in root.find(_W_BODY).iterchildren(_W_P)
+        ]
+    except (KeyError, AttributeError, zipfile.BadZipFile, etree.XMLSyntaxError):
+        import docx
+        return [p.text for p in docx.Document(path).paragraphs]
@@ -1,37 +1,99 @@
 import os
+import re
 import sys
+import queue
 import threading
-import json
+import functools
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 from pathlib import Path
-import docx
 import main  # Import functionality from main.py
 
+# Default location for generated files, resolved once at import
+_BASE_DIR = Path(__file__).resolve().parent
+_DATA_DIR = _BASE_DIR / "data"
+
+# Inputs each task type requires
+_NEEDS_RESUME = frozenset({"analyze_resume", "customize_resume", "cover_letter", "match_job"})
+_NEEDS_JOB = frozenset({"analyze_job", "customize_resume", "cover_letter", "match_job"})
+_NEEDS_OUTPUT = frozenset({"customize_resume", "cover_letter"})
+
+# Suggested file names for tasks that save output
+_DEFAULT_OUTPUT_NAMES = {
+    "cover_letter": "Cover_Letter.docx",
+    "customize_resume": "Customized_Resume.docx",
+}
+
+# Delay used to coalesce status bar and progress bar updates
+_UI_FLUSH_DELAY_MS = 50
+
+# Characters of a result inserted per idle callback
+_RESULT_CHUNK_CHARS = 8192
+
+# How often a closed window checks whether the worker has finished
+_CLOSE_POLL_MS = 100
+
+# How long the "saved" notice stays on screen
+_TOAST_DURATION_MS = 3000
+
+# Matches a ```json fenced block in LLM output and captures its body
+_JSON_FENCE_RE = re.compile(r"```json\s*(.*?)\s*```", re.DOTALL)
+
+# Leading name in a resume filename such as "Jane_Doe-Acme-Engineer.docx"
+_NAME_RE = re.compile(r"^([^-_.]+(?:[ _][^-_.]+)?)")
+
+@functools.lru_cache(maxsize=1)
+def _data_dir():
+    """Return the default output directory, creating it on first use only."""
+    _DATA_DIR.mkdir(exist_ok=True)
+    return _DATA_DIR
+
 class AIResumeToolsGUI:
+    _INPUT_FILETYPES = (("Word Documents", "*.docx"), ("All files", "*.*"))
+    _OUTPUT_FILETYPES = (("Word Documents", "*.docx"), ("Text files", "*.txt"))
+    
     def __init__(self, root):
-        self.root = root
         self.root = root
         self.root.title("AI Resume Tools v1.0")
         self.root.geometry("900x700")
         
         # Create variables to store file paths
-        # Create variables to store file paths
-        self.resume_path = tk.StringVar()
-        self.job_desc_path = tk.StringVar()
-        self.job_desc_text = tk.StringVar()  # Added variable for pasted job description text
-        self.output_path = tk.StringVar()
-        self.candidate_name = tk.StringVar()
-        self.company_name = tk.StringVar()
-        self.ask_each_time = tk.BooleanVar(value=False)  # Variable for "Ask each time" checkbox
+        self.resume_path = tk.StringVar(master=root)
+        self.job_desc_path = tk.StringVar(master=root)
+        self.output_path = tk.StringVar(master=root)
+        self.candidate_name = tk.StringVar(master=root)
+        self.company_name = tk.StringVar(master=root)
+        self.ask_each_time = tk.BooleanVar(master=root, value=False)  # Variable for "Ask each time" checkbox
+        # Dialog title, target variable and post-selection hook per input kind
+        self._browse_specs = {
+            "resume": ("Select Resume", self.resume_path, self._on_resume_selected),
+            "job": ("Select Job Description", self.job_desc_path, None),
+        }
         # Create status variables
-        self.status_var = tk.StringVar()
-        self.status_var.set("Ready")
-        self.is_processing = False
+        self.status_var = tk.StringVar(master=root, value="Ready")
+        # Set while a task is queued or running; only the Tk thread changes it
+        self._busy = threading.Event()
+        
+        # Latest (busy, status) requested for the status bar, applied after a
+        # short delay so back-to-back changes cost a single Tk update
+        self._ui_state = (False, "Ready")
+        self._ui_pending = None
+        
+        # Incremented each time the results pane is replaced
+        self._result_generation = 0
+        
+        # A single long-lived worker runs queued tasks off the Tk thread
+        self._task_q = queue.Queue()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         
         self.create_widgets()
         
     def create_widgets(self):
+        # Keep the window hidden while building so geometry is computed once
+        self.root.withdraw()
+        
         # Title
         title_label = ttk.Label(self.root, text="AI Resume Tools v1.0", font=("Arial", 16, "bold"))
         title_label.grid(row=0, column=0, columnspan=3, sticky="w", pady=(0, 20))
@@ -48,12 +110,12 @@ class AIResumeToolsGUI:
         # Resume file
         ttk.Label(file_frame, text="Resume:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
         ttk.Entry(file_frame, textvariable=self.resume_path, width=50).grid(row=0, column=1, sticky="ew", padx=5, pady=5)
-        ttk.Button(file_frame, text="Browse", command=self.browse_resume).grid(row=0, column=2, padx=5, pady=5)
+        ttk.Button(file_frame, text="Browse", command=functools.partial(self._browse, "resume")).grid(row=0, column=2, padx=5, pady=5)
         
         # Job description file
         ttk.Label(file_frame, text="Job Description:").grid(row=1, column=0, sticky="w", padx=5, pady=5)
         ttk.Entry(file_frame, textvariable=self.job_desc_path, width=50).grid(row=1, column=1, sticky="ew", padx=5, pady=5)
-        ttk.Button(file_frame, text="Browse", command=self.browse_job_desc).grid(row=1, column=2, padx=5, pady=5)
+        ttk.Button(file_frame, text="Browse", command=functools.partial(self._browse, "job")).grid(row=1, column=2, padx=5, pady=5)
         
         # Job Description Text Box
         jd_text_frame = ttk.LabelFrame(self.root, text="Paste Job Description Here")
@@ -96,26 +158,33 @@ class AIResumeToolsGUI:
         action_frame = ttk.Frame(self.root)
         action_frame.grid(row=4, column=0, columnspan=4, sticky="ew", padx=5, pady=5)
         
-        ttk.Button(action_frame, text="Analyze Resume", command=lambda: self.run_task("analyze_resume")).grid(row=0, column=0, padx=5, pady=5)
-        ttk.Button(action_frame, text="Analyze Job Description", command=lambda: self.run_task("analyze_job")).grid(row=0, column=1, padx=5, pady=5)
+        analyze_resume_btn = ttk.Button(action_frame, text="Analyze Resume",
+                                        command=functools.partial(self.run_task, "analyze_resume"))
+        analyze_resume_btn.grid(row=0, column=0, padx=5, pady=5)
+        analyze_job_btn = ttk.Button(action_frame, text="Analyze Job Description",
+                                     command=functools.partial(self.run_task, "analyze_job"))
+        analyze_job_btn.grid(row=0, column=1, padx=5, pady=5)
         
-        # Use lambda to pass the task_type to browse_output when opening the file dialog
+        # Right-click opens the save dialog with a default name for that task
         customize_btn = ttk.Button(action_frame, text="Customize Resume", 
-                               command=lambda: self.run_task("customize_resume"))
+                               command=functools.partial(self.run_task, "customize_resume"))
         customize_btn.grid(row=0, column=2, padx=5, pady=5)
-        customize_btn.bind("<Button-3>", lambda e: self.browse_output("customize_resume"))
+        customize_btn.bind("<Button-3>", functools.partial(self._browse_output_on_click, "customize_resume"))
         
         cover_letter_btn = ttk.Button(action_frame, text="Generate Cover Letter", 
-                                 command=lambda: self.run_task("cover_letter"))
-        cover_letter_btn.grid(row=0, column=3, padx=5, pady=5)
+                                 command=functools.partial(self.run_task, "cover_letter"))
         cover_letter_btn.grid(row=0, column=3, padx=5, pady=5)
-        cover_letter_btn.bind("<Button-3>", lambda e: self.browse_output("cover_letter"))
+        cover_letter_btn.bind("<Button-3>", functools.partial(self._browse_output_on_click, "cover_letter"))
         
         # Add Match Job Fit button
         match_job_btn = ttk.Button(action_frame, text="Match Job Fit", 
-                               command=lambda: self.run_task("match_job"))
+                               command=functools.partial(self.run_task, "match_job"))
         match_job_btn.grid(row=0, column=4, padx=5, pady=5)
         
+        # Disabled together while a task runs
+        self._action_buttons = (analyze_resume_btn, analyze_job_btn, customize_btn,
+                                cover_letter_btn, match_job_btn)
+        
         # Results area
         result_frame = ttk.LabelFrame(self.root, text="Results")
         result_frame.grid(row=5, column=0, columnspan=4, sticky="nsew", padx=5, pady=5)
@@ -136,41 +205,38 @@ class AIResumeToolsGUI:
         
         status_label = ttk.Label(status_frame, textvariable=self.status_var)
         status_label.grid(row=0, column=1, padx=5, pady=5)
+        
+        # Transient notice placed over the window; hidden until _toast is called
+        self._toast_label = ttk.Label(self.root, background="#dff0d8", foreground="#3c763d",
+                                      padding=(10, 5))
+        self._toast_after = None
+        
+        self.root.update_idletasks()
+        self.root.deiconify()
     
-    def browse_resume(self):
-        filename = filedialog.askopenfilename(
-            title="Select Resume",
-            filetypes=[("Word Documents", "*.docx"), ("All files", "*.*")]
-        )
+    def _browse(self, kind):
+        """Ask for an input file of the given kind ('resume' or 'job') and store its path."""
+        title, path_var, on_selected = self._browse_specs[kind]
+        filename = filedialog.askopenfilename(title=title, filetypes=self._INPUT_FILETYPES)
         if filename:
-            self.resume_path.set(filename)
-            # Try to extract candidate name from filename
-            name = Path(filename).stem
-            if "-" in name:
-                name = name.split("-")[0].strip()
-            self.candidate_name.set(name)
+            path_var.set(filename)
+            if on_selected is not None:
+                on_selected(filename)
     
-    def browse_job_desc(self):
-        filename = filedialog.askopenfilename(
-            title="Select Job Description",
-            filetypes=[("Word Documents", "*.docx"), ("All files", "*.*")]
-        )
-        if filename:
-            self.job_desc_path.set(filename)
+    def _on_resume_selected(self, filename):
+        # Try to extract candidate name from filename
+        match = _NAME_RE.match(os.path.basename(filename))
+        self.candidate_name.set(match.group(1).replace("_", " ").strip() if match else "")
     
     def browse_output(self, task_type=None):
         # Set a descriptive default filename based on the operation
-        initial_file = ""
-        if task_type == "cover_letter":
-            initial_file = "Cover_Letter.docx"
-        elif task_type == "customize_resume":
-            initial_file = "Customized_Resume.docx"
+        initial_file = _DEFAULT_OUTPUT_NAMES.get(task_type, "")
         
         filename = filedialog.asksaveasfilename(
             title="Save Output As",
             defaultextension=".docx",
             initialfile=initial_file,
-            filetypes=[("Word Documents", "*.docx"), ("Text files", "*.txt")]
+            filetypes=self._OUTPUT_FILETYPES
         )
         if filename:
             self.output_path.set(filename)
@@ -178,6 +244,9 @@ class AIResumeToolsGUI:
             self.ask_each_time.set(False)
             self.toggle_output_entry_state()
     
+    def _browse_output_on_click(self, task_type, event=None):
+        self.browse_output(task_type)
+    
     def toggle_output_entry_state(self):
         """Enable or disable the output entry field based on the 'Ask each time' checkbox"""
         if self.ask_each_time.get():
@@ -187,40 +256,39 @@ class AIResumeToolsGUI:
             self.output_entry.configure(state="normal")
     
     def run_task(self, task_type):
-        if self.is_processing:
-            messagebox.showwarning("Process Running", "Please wait until the current task completes.")
+        # The action buttons are disabled while busy, so this only catches
+        # events that were already queued when the task started
+        if self._busy.is_set():
             return
         
+        # Read the pasted job description once, on the Tk thread; the worker
+        # thread receives it as an argument instead of touching the widget
+        job_desc_text = self.job_desc_text_area.get("1.0", "end-1c")
+        if job_desc_text.isspace():
+            job_desc_text = ""
+        resume = self.resume_path.get()
+        job_file = self.job_desc_path.get()
+        output = self.output_path.get()
+        
         # Validate inputs
-        if task_type in ["analyze_resume", "customize_resume", "cover_letter"]:
-            if not self.resume_path.get():
-                messagebox.showerror("Input Error", "Please select a resume file.")
-                return
+        if task_type in _NEEDS_RESUME and not resume:
+            messagebox.showerror("Input Error", "Please select a resume file.")
+            return
         
-        if task_type in ["analyze_job", "customize_resume", "cover_letter", "match_job"]:
-            job_desc_text = self.job_desc_text_area.get("1.0", tk.END).strip()
-            # Check if either job description file or pasted text is provided
-            if not self.job_desc_path.get() and not job_desc_text:
-                messagebox.showerror("Input Error", "Please either select a job description file or paste job description text.")
-                return
+        # Check if either job description file or pasted text is provided
+        if task_type in _NEEDS_JOB and not job_file and not job_desc_text:
+            messagebox.showerror("Input Error", "Please either select a job description file or paste job description text.")
+            return
         
         if task_type == "cover_letter":
             if not self.candidate_name.get() or not self.company_name.get():
                 messagebox.showerror("Input Error", "Please provide candidate name and company name for cover letter.")
                 return
         
-        if task_type in ["customize_resume", "cover_letter"]:
-            if not self.output_path.get() and not self.ask_each_time.get():
+        if task_type in _NEEDS_OUTPUT:
+            if not output and not self.ask_each_time.get():
                 # Set default output path if none is specified
-                data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
-                os.makedirs(data_dir, exist_ok=True)
-                
-                if task_type == "customize_resume":
-                    default_filename = "Customized_Resume.docx"
-                elif task_type == "cover_letter":
-                    default_filename = "Cover_Letter.docx"
-                    
-                default_path = os.path.join(data_dir, default_filename)
+                default_path = str(_data_dir() / _DEFAULT_OUTPUT_NAMES[task_type])
                 self.output_path.set(default_path)
                 self.result_text.insert(tk.END, f"No output file specified. Using default: {default_path}\n\n")
                 
@@ -233,54 +301,134 @@ class AIResumeToolsGUI:
                     self.browse_output(task_type)
                     if not self.output_path.get():  # User cancelled file dialog
                         return
-        # Run the task in a separate thread to keep UI responsive
-        thread = threading.Thread(target=self.execute_task, args=(task_type,))
-        thread.daemon = True
-        thread.start()
-    
-    def execute_task(self, task_type):
-        self.is_processing = True
-        self.status_var.set(f"Processing: {task_type.replace('_', ' ').title()}...")
-        self.progress_bar.start(10)
+        # Hand the task to the worker thread to keep UI responsive. The flag is
+        # set here, on the Tk thread, so a second click cannot slip in first.
+        self._busy.set()
+        for button in self._action_buttons:
+            button.state(["disabled"])
+        self._set_busy_state(True, f"Processing: {task_type.replace('_', ' ').title()}...")
+        self._result_generation += 1
         self.result_text.delete(1.0, tk.END)
-        
+        self._task_q.put((task_type, job_desc_text))
+    
+    def _worker_loop(self):
+        while True:
+            task = self._task_q.get()
+            if task is None:  # shutdown sentinel from _on_close
+                break
+            self.execute_task(*task)
+    
+    def _on_close(self):
+        # Hide the window right away, but keep Tk alive until the worker has
+        # finished any running task, so it can still post its result and a
+        # file being written is not cut off by the process exiting
+        self.root.withdraw()
+        self._task_q.put(None)
+        self._destroy_when_idle()
+    
+    def _destroy_when_idle(self):
+        if self._worker.is_alive():
+            self.root.after(_CLOSE_POLL_MS, self._destroy_when_idle)
+        else:
+            self.root.destroy()
+    
+    def execute_task(self, task_type, job_desc_text):
+        result = None
+        error_msg = None
+        saved_path = None
         try:
             if task_type == "analyze_resume":
                 result = self.analyze_document("resume")
             elif task_type == "analyze_job":
-                result = self.analyze_document("job")
+                result = self.analyze_document("job", job_desc_text)
             elif task_type == "customize_resume":
-                result = self.customize_resume()
+                result, saved_path = self.customize_resume(job_desc_text)
             elif task_type == "cover_letter":
-                result = self.generate_cover_letter()
+                result, saved_path = self.generate_cover_letter(job_desc_text)
             elif task_type == "match_job":
-                result = self.compare_job_match()
-            
-            # Update UI with result
-            self.root.after(0, lambda: self.update_result(result))
-            
+                result = self.compare_job_match(job_desc_text)
         except Exception as e:
             error_msg = f"Error: {str(e)}"
-            self.root.after(0, lambda: self.show_error(error_msg))
         
-        finally:
-            self.root.after(0, self.reset_ui)
+        # Hand all UI updates back to the Tk thread in a single callback. The
+        # root outlives the worker, but don't let a torn-down interpreter turn
+        # into a traceback from this thread.
+        try:
+            self.root.after_idle(self._finish_task, result, error_msg, saved_path)
+        except (tk.TclError, RuntimeError):
+            pass
+    
+    def _finish_task(self, result, error_msg, saved_path=None):
+        self.reset_ui(f"✅ Saved: {saved_path}" if saved_path else "Ready")
+        if saved_path:
+            self._toast(f"Saved to: {saved_path}")
+        if error_msg is None:
+            self.update_result(result)
+        else:
+            self.show_error(error_msg)
+    
+    def _toast(self, message, duration_ms=_TOAST_DURATION_MS):
+        """Show a non-modal notice that hides itself; a dialog would stall the mainloop."""
+        if self._toast_after is not None:
+            self.root.after_cancel(self._toast_after)
+        self._toast_label.configure(text=message)
+        self._toast_label.place(relx=0.5, rely=0.05, anchor="n")
+        self._toast_label.lift()
+        self._toast_after = self.root.after(duration_ms, self._hide_toast)
+    
+    def _hide_toast(self):
+        self._toast_after = None
+        self._toast_label.place_forget()
     
     def update_result(self, result):
-        self.result_text.delete(1.0, tk.END)
-        self.result_text.insert(tk.END, result)
+        self._replace_result_text(result)
     
     def show_error(self, error_msg):
-        self.result_text.delete(1.0, tk.END)
-        self.result_text.insert(tk.END, error_msg)
+        self._replace_result_text(error_msg)
         messagebox.showerror("Error", error_msg)
     
-    def reset_ui(self):
-        self.progress_bar.stop()
-        self.is_processing = False
-        self.status_var.set("Ready")
+    def _replace_result_text(self, text):
+        """Show text in the results pane, scrolled to the top."""
+        widget = self.result_text
+        widget.configure(state="normal")
+        widget.delete("1.0", tk.END)
+        widget.see("1.0")
+        # Insert long reports in idle-time batches so the event loop keeps
+        # running; bumping the generation cancels a stream still in flight
+        self._result_generation += 1
+        self._stream_insert(self._result_generation, text, 0)
+    
+    def _stream_insert(self, generation, text, start):
+        if generation != self._result_generation:
+            return
+        end = start + _RESULT_CHUNK_CHARS
+        self.result_text.insert(tk.END, text[start:end])
+        if end < len(text):
+            self.root.after_idle(self._stream_insert, generation, text, end)
+        else:
+            self.result_text.mark_set("insert", "1.0")
+    
+    def reset_ui(self, status="Ready"):
+        self._busy.clear()
+        for button in self._action_buttons:
+            button.state(["!disabled"])
+        self._set_busy_state(False, status)
+    
+    def _set_busy_state(self, busy, status):
+        self._ui_state = (busy, status)
+        if self._ui_pending is None:
+            self._ui_pending = self.root.after(_UI_FLUSH_DELAY_MS, self._flush_ui)
     
-    def analyze_document(self, doc_type):
+    def _flush_ui(self):
+        self._ui_pending = None
+        busy, status = self._ui_state
+        self.status_var.set(status)
+        if busy:
+            self.progress_bar.start(80)
+        else:
+            self.progress_bar.stop()
+    
+    def analyze_document(self, doc_type, job_desc_text=""):
         try:
             if doc_type == "resume":
                 file_path = self.resume_path.get()
@@ -289,66 +437,39 @@ class AIResumeToolsGUI:
                 result = main.analyze_document(file_path, doc_type_str)
             else:  # job description
                 doc_type_str = "job"
-                job_desc_text = self.job_desc_text_area.get("1.0", tk.END).strip()
-                
                 # Prioritize pasted text over file input
-                if job_desc_text:
-                    # Save the pasted text to a temporary file
-                    temp_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "temp_job_desc.txt")
-                    os.makedirs(os.path.dirname(temp_file), exist_ok=True)
-                    
-                    with open(temp_file, "w", encoding="utf-8") as f:
-                        f.write(job_desc_text)
-                    
-                    # Call the analyze function with the temp file
-                    result = main.analyze_document(temp_file, doc_type_str)
-                else:
-                    file_path = self.job_desc_path.get()
-                    # Call the analyze function with the selected file
-                    result = main.analyze_document(file_path, doc_type_str)
+                job_desc_content = job_desc_text or None
+                file_path = None if job_desc_content else self.job_desc_path.get()
+                result = main.analyze_document(file_path, doc_type_str, job_desc_content=job_desc_content)
             return result
         except Exception as e:
             raise Exception(f"Error analyzing {doc_type}: {str(e)}")
     
-    def customize_resume(self):
+    def customize_resume(self, job_desc_text):
         try:
             resume_path = self.resume_path.get()
-            job_desc_text = self.job_desc_text_area.get("1.0", tk.END).strip()
             output_path = self.output_path.get()
             
             # Determine which job description source to use (prioritize pasted text)
-            if job_desc_text:
-                # Save the pasted text to a temporary file
-                temp_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "temp_job_desc.txt")
-                os.makedirs(os.path.dirname(temp_file), exist_ok=True)
-                
-                with open(temp_file, "w", encoding="utf-8") as f:
-                    f.write(job_desc_text)
-                
-                job_path = temp_file
-            else:
-                job_path = self.job_desc_path.get()
+            job_desc_content = job_desc_text or None
+            job_path = None if job_desc_content else self.job_desc_path.get()
             
             # Call the process_resume_customization function from main.py
-            result = main.process_resume_customization(resume_path, job_path, output_path)
+            result = main.process_resume_customization(resume_path, job_path, output_path,
+                                                       job_desc_content=job_desc_content)
             
-            # If successful, show success message
-            if os.path.exists(output_path):
-                # Show success message box
-                messagebox.showinfo(
-                    "Success", 
-                    f"Customized resume created successfully!\nSaved to: {output_path}"
-                )
-                return f"✅ CUSTOMIZED RESUME CREATED SUCCESSFULLY!\nSaved to: {output_path}\n\n{result}"
-            else:
-                raise Exception("Output file was not created")
+            if not result["ok"]:
+                raise Exception(result["message"])
+            
+            # Report the saved location
+            saved_path = result["path"]
+            return f"✅ CUSTOMIZED RESUME CREATED SUCCESSFULLY!\nSaved to: {saved_path}\n\n{result['message']}", saved_path
         except Exception as e:
             raise Exception(f"Error customizing resume: {str(e)}")
     
-    def generate_cover_letter(self):
+    def generate_cover_letter(self, job_desc_text):
         try:
             resume_path = self.resume_path.get()
-            job_desc_text = self.job_desc_text_area.get("1.0", tk.END).strip()
             name = self.candidate_name.get()
             company = self.company_name.get()
             
@@ -359,117 +480,71 @@ class AIResumeToolsGUI:
                 output_path = self.output_path.get()
             
             # Determine which job description source to use (prioritize pasted text)
-            if job_desc_text:
-                # Save the pasted text to a temporary file
-                temp_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "temp_job_desc.txt")
-                os.makedirs(os.path.dirname(temp_file), exist_ok=True)
-                
-                with open(temp_file, "w", encoding="utf-8") as f:
-                    f.write(job_desc_text)
-                
-                job_path = temp_file
-            else:
-                job_path = self.job_desc_path.get()
+            job_desc_content = job_desc_text or None
+            job_path = None if job_desc_content else self.job_desc_path.get()
             
             # Call the process_cover_letter function from main.py
-            result = main.process_cover_letter(resume_path, job_path, name, company, output_path)
+            result = main.process_cover_letter(resume_path, job_path, name, company, output_path,
+                                               job_desc_content=job_desc_content)
             
-            # Check if the operation was canceled
-            if "Error: Cover letter generation canceled" in result:
-                return result
+            # Check if the operation was canceled or failed
+            if result["canceled"]:
+                return result["message"], None
+            if not result["ok"]:
+                raise Exception(result["message"])
             
-            # Extract the actual output path from the result message
-            import re
-            path_match = re.search(r"saved to (.+)$", result)
-            if path_match:
-                actual_output_path = path_match.group(1)
-                
-                # If successful, show success message
-                if os.path.exists(actual_output_path):
-                    # Show success message box
-                    messagebox.showinfo(
-                        "Success", 
-                        f"Cover letter created successfully!\nSaved to: {actual_output_path}"
-                    )
-                    return f"✅ COVER LETTER CREATED SUCCESSFULLY!\nSaved to: {actual_output_path}\n\n{result}"
-                else:
-                    raise Exception("Output file was not created")
-            else:
-                raise Exception("Could not determine output path from result message")
+            actual_output_path = result["path"]
+            
+            # Report the saved location
+            return (f"✅ COVER LETTER CREATED SUCCESSFULLY!\nSaved to: {actual_output_path}\n\n{result['message']}",
+                    actual_output_path)
         except Exception as e:
             raise Exception(f"Error generating cover letter: {str(e)}")
             
-    def compare_job_match(self):
+    def compare_job_match(self, job_desc_text):
         """
         Compare resume with job description to determine fit and provide analysis.
         """
         try:
             resume_path = self.resume_path.get()
-            job_desc_text = self.job_desc_text_area.get("1.0", tk.END).strip()
             
             # Determine which job description source to use (prioritize pasted text)
-            if job_desc_text:
-                # Save the pasted text to a temporary file
-                temp_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "temp_job_desc.txt")
-                os.makedirs(os.path.dirname(temp_file), exist_ok=True)
-                
-                with open(temp_file, "w", encoding="utf-8") as f:
-                    f.write(job_desc_text)
-                
-                job_path = temp_file
-            else:
-                job_path = self.job_desc_path.get()
+            job_desc_content = job_desc_text or None
+            job_path = None if job_desc_content else self.job_desc_path.get()
             
             # Call the process_job_match function from main.py
-            result = main.process_job_match(resume_path, job_path)
+            result = main.process_job_match(resume_path, job_path, job_desc_content=job_desc_content)
             
             # Format the result nicely
             try:
                 # Extract JSON content from markdown code blocks if present
-                if isinstance(result, str) and "```json" in result and "```" in result:
-                    # Find the JSON content between ```json and the next ```
-                    start_marker = "```json"
-                    end_marker = "```"
-                    start_index = result.find(start_marker) + len(start_marker)
-                    end_index = result.find(end_marker, start_index)
-                    
-                    if start_index > 0 and end_index > start_index:
-                        # Extract just the JSON content
-                        json_content = result[start_index:end_index].strip()
-                        job_match = json.loads(json_content)
-                    else:
-                        # If markers not found as expected, try parsing the whole string
-                        job_match = json.loads(result)
-                else:
-                    # No markdown formatting, parse directly
-                    job_match = json.loads(result)
-                
-                formatted_result = f"# Job Match Analysis\n\n"
-                formatted_result += f"## Match Score: {job_match['match_score']}%\n\n"
+                fence_match = _JSON_FENCE_RE.search(result) if isinstance(result, str) else None
+                job_match = main.JobMatch.model_validate_json(fence_match.group(1) if fence_match else result)
                 
-                formatted_result += "## Strengths:\n"
-                for strength in job_match['strengths']:
-                    formatted_result += f"- {strength}\n"
-                
-                formatted_result += "\n## Weaknesses:\n"
-                for weakness in job_match['weaknesses']:
-                    formatted_result += f"- {weakness}\n"
-                
-                formatted_result += "\n## Matching Skills:\n"
-                for skill in job_match['matching_skills']:
-                    formatted_result += f"- {skill}\n"
-                
-                formatted_result += "\n## Missing Skills:\n"
-                for skill in job_match['missing_skills']:
-                    formatted_result += f"- {skill}\n"
-                
-                formatted_result += f"\n## Experience Alignment:\n{job_match['experience_alignment']}\n\n"
-                
-                formatted_result += "## Recommendations:\n"
-                for rec in job_match['recommendations']:
-                    formatted_result += f"- {rec}\n"
-                
-                return formatted_result
+                parts = [
+                    "# Job Match Analysis",
+                    "",
+                    f"## Match Score: {job_match.match_score}%",
+                    "",
+                    "## Strengths:",
+                    *(f"- {strength}" for strength in job_match.strengths),
+                    "",
+                    "## Weaknesses:",
+                    *(f"- {weakness}" for weakness in job_match.weaknesses),
+                    "",
+                    "## Matching Skills:",
+                    *(f"- {skill}" for skill in job_match.matching_skills),
+                    "",
+                    "## Missing Skills:",
+                    *(f"- {skill}" for skill in job_match.missing_skills),
+                    "",
+                    "## Experience Alignment:",
+                    job_match.experience_alignment,
+                    "",
+                    "## Recommendations:",
+                    *(f"- {rec}" for rec in job_match.recommendations),
+                ]
+                return "\n".join(parts) + "\n"
             except Exception as e:
                 # If JSON parsing fails, log the error and return the raw result
                 print(f"Error parsing job match result: {e}")
@@ -505,26 +580,11 @@ Note: This application requires an OpenAI API key in the .env file.
 """
         messagebox.showinfo("Help", help_text)
 
-def save_as_docx(text, output_path):
-    """
-    Save text as a properly formatted .docx file
-    """
-    doc = docx.Document()
-    
-    # Split text into paragraphs
-    paragraphs = text.split('\n')
-    
-    # Add each paragraph to the document
-    for para in paragraphs:
-        if para.strip():  # Only add non-empty paragraphs
-            doc.add_paragraph(para)
-    
-    # Save the document
-    doc.save(output_path)
-
 def main_gui():
     root = tk.Tk()
     app = AIResumeToolsGUI(root)
+    # Load slow dependencies while the user is still picking files
+    threading.Thread(target=main.warmup, daemon=True).start()
     root.mainloop()
 
 if __name__ == "__main__":
@@ -9,20 +9,25 @@ based on job descriptions, using OpenAI APIs via LangChain.
 import os
 import sys
 import argparse
+import atexit
 import json
-from typing import Dict, Any, Optional
+import hashlib
+import functools
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Optional
 from pathlib import Path
-import pandas as pd
-import docx
-import tkinter as tk
-from tkinter import filedialog
+import httpx
 
 # Import LangChain and OpenAI components
 from langchain_openai import ChatOpenAI
-from langchain.prompts import PromptTemplate, ChatPromptTemplate
-from langchain.output_parsers import PydanticOutputParser
-from pydantic import BaseModel, Field
-from langchain.schema.runnable import RunnableSequence
+from langchain.prompts import ChatPromptTemplate
+from langchain_core.exceptions import OutputParserException
+from langchain_core.output_parsers import StrOutputParser
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -34,21 +39,61 @@ if not os.getenv("OPENAI_API_KEY"):
     print("Please add your OpenAI API key to the .env file.")
     sys.exit(1)
 
-# Initialize OpenAI model
+# Initialize OpenAI model. gpt-4o-mini is much cheaper and faster than gpt-4o
+# and good enough for these tasks; set OPENAI_MODEL=gpt-4o for the larger model.
+MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+
+# One connection pool shared by every model client, sized for bulk runs, so
+# repeated and concurrent calls reuse open TLS connections to the API
+_http_client = httpx.Client(
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+    timeout=60.0,
+)
+atexit.register(_http_client.close)
+
 llm = ChatOpenAI(
-    model_name="gpt-4o",  # Using the most capable model, change to gpt-3.5-turbo for cost savings
+    model_name=MODEL,
     temperature=0.7,
+    http_client=_http_client,
 )
 
+# The resume digest only condenses text, so it always runs on the cheap model,
+# whatever --model picks for the analyses and generations themselves
+_DIGEST_MODEL = "gpt-4o-mini"
+_digest_llm = ChatOpenAI(model_name=_DIGEST_MODEL, temperature=0, http_client=_http_client)
+
+def set_model(model_name: str) -> None:
+    """Switch every subsequent LLM call in this process to model_name."""
+    global llm
+    llm = ChatOpenAI(model_name=model_name, temperature=0.7, http_client=_http_client)
+    _structured_llm.cache_clear()
+
 # Define output models
-class ResumeAnalysis(BaseModel):
+class OutputModel(BaseModel):
+    """
+    Base for models parsed from LLM output.
+    
+    Instances are immutable, since analyses are shared through the caches, and
+    unexpected keys in a response are dropped instead of stored.
+    """
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+class PromptModel(OutputModel):
+    """Base for models whose JSON is fed into later prompts."""
+    
+    @functools.cached_property
+    def prompt_json(self) -> str:
+        """Compact JSON for prompt inputs, serialized once per instance."""
+        return self.model_dump_json(exclude_none=True)
+
+class ResumeAnalysis(PromptModel):
     """Analysis of a resume."""
     skills: list[str] = Field(description="List of skills extracted from the resume")
     experience: list[Dict[str, Any]] = Field(description="List of work experiences")
     education: list[Dict[str, Any]] = Field(description="Educational background")
     summary: str = Field(description="Brief summary of the candidate's profile")
 
-class JobAnalysis(BaseModel):
+class JobAnalysis(PromptModel):
     """Analysis of a job description."""
     required_skills: list[str] = Field(description="Skills required for the job")
     preferred_skills: list[str] = Field(description="Skills that are preferred but not required")
@@ -56,7 +101,7 @@ class JobAnalysis(BaseModel):
     company_values: list[str] = Field(description="Company values extracted from the description")
     keywords: list[str] = Field(description="Important keywords from the job description")
 
-class JobMatch(BaseModel):
+class JobMatch(OutputModel):
     """Analysis of how well a resume matches a job description."""
     match_score: int = Field(description="Percentage (0-100) representing overall match")
     matching_skills: list[str] = Field(description="List of skills that match job requirements")
@@ -66,204 +111,672 @@ class JobMatch(BaseModel):
     strengths: list[str] = Field(description="List of candidate's strengths for this position")
     weaknesses: list[str] = Field(description="List of areas where the candidate may fall short")
 
-class ResumeCustomization(BaseModel):
+class CombinedAnalysis(OutputModel):
+    """Analyses of a resume and a job description extracted together."""
+    resume: ResumeAnalysis = Field(description="Analysis of the resume")
+    job: JobAnalysis = Field(description="Analysis of the job description")
+
+class ResumeCustomization(PromptModel):
     """Customization suggestions for a resume."""
     highlighted_skills: list[str] = Field(description="Skills to highlight based on job match")
     experience_emphasize: Dict[str, list[str]] = Field(description="Aspects of experience to emphasize")
     suggested_additions: list[str] = Field(description="Suggested additions to the resume")
     suggested_removals: list[str] = Field(description="Content that could be removed or de-emphasized")
 
+# Prompt templates, built once at import. Static instructions go in the
+# system message and per-request content last, so OpenAI can reuse the
+# cached prompt prefix.
+_RESUME_ANALYSIS_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", "Analyze the resume provided by the user and extract key information."),
+    ("human", "{resume}"),
+])
+
+_JOB_ANALYSIS_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", "Analyze the job description provided by the user and extract key information."),
+    ("human", "{job}"),
+])
+
+_PAIR_ANALYSIS_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", "Analyze the resume and job description provided by the user and extract key information from each."),
+    ("human", """Resume:
+{resume}
+
+Job Description:
+{job}"""),
+])
+
+_CUSTOMIZATION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", "Given a resume analysis and job description analysis, suggest ways to customize the resume."),
+    ("human", """Resume Analysis:
+{resume_analysis}
+
+Job Analysis:
+{job_analysis}"""),
+])
+
+_COVER_LETTER_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are a professional cover letter writer. Create a compelling cover letter for the candidate and company named by the user.
+The cover letter should be professional, engaging, and tailored to the specific job.
+
+Important guidelines:
+1. Keep the length to one page (approximately 400 words)
+2. Address how the candidate's experience aligns with job requirements
+3. Highlight relevant skills and achievements
+4. Demonstrate understanding of the company values
+5. Include a strong opening and closing
+6. Use a professional, confident tone
+7. Format as a formal business letter"""),
+    ("human", """Candidate: {candidate_name}
+Company: {company_name}
+
+Resume Information:
+{resume_info}
+
+Job Information:
+{job_info}
+
+Create the full cover letter text now:"""),
+])
+
+_CUSTOMIZED_RESUME_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are a professional resume writer. Create a customized version of the user's resume based on the customization suggestions.
+Keep the same general format, but implement the suggested changes to better target the specific job opportunity.
+
+Important guidelines:
+1. Highlight the skills that match the job requirements
+2. Emphasize relevant experience aspects
+3. Add suggested content where appropriate
+4. Remove or de-emphasize less relevant content
+5. Keep professional formatting
+6. Maintain approximately the same length as the original"""),
+    ("human", """Original Resume:
+{resume}
+
+Customization Suggestions:
+{customization}
+
+Create the full customized resume now:"""),
+])
+
+_DIRECT_RESUME_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are a professional resume writer. Create a customized version of the user's resume that better targets the job described in the job analysis.
+Keep the same general format. First decide which skills to highlight, which experience to emphasize, and what to add or remove, then apply those changes.
+
+Important guidelines:
+1. Highlight the skills that match the job requirements
+2. Emphasize relevant experience aspects
+3. Add content that addresses the job's requirements where the resume supports it
+4. Remove or de-emphasize less relevant content
+5. Keep professional formatting
+6. Maintain approximately the same length as the original
+
+Respond with only the full customized resume."""),
+    ("human", """Original Resume:
+{resume}
+
+Resume Analysis:
+{resume_analysis}
+
+Job Analysis:
+{job_analysis}
+
+Create the full customized resume now:"""),
+])
+
+_MATCH_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """Analyze how well the resume matches the job description and provide a detailed assessment.
+Provide a detailed assessment of how well the candidate's profile matches this job opportunity.
+Be objective and analytical, assessing both strengths and weaknesses. 
+Consider skills match, experience alignment, and overall fit."""),
+    ("human", """Resume Analysis:
+{resume_analysis}
+
+Job Description Analysis:
+{job_analysis}"""),
+])
+
+_RESUME_DIGEST_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """Condense the user's resume into a compact plain-text digest of at most about 1500 tokens.
+Keep every skill, job title, employer, date range, degree, certification and quantified achievement.
+Drop repetition, boilerplate and formatting."""),
+    ("human", "{resume}"),
+])
+
 def load_document(file_path: str) -> str:
-    """Load a document from a file."""
+    """
+    Load a document from a file.
+    
+    The extracted text is memoized by path, modification time and size, so
+    loading an unchanged file again skips the .docx XML parse.
+    """
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File {file_path} not found") from None
+    return _load_document_cached(file_path, st.st_mtime_ns, st.st_size)
+
+@functools.lru_cache(maxsize=64)
+def _load_document_cached(file_path: str, mtime_ns: int, size: int) -> str:
     path = Path(file_path)
-    if not path.exists():
-        raise FileNotFoundError(f"File {file_path} not found")
     
     # Check file extension to determine how to load the document
     if path.suffix.lower() == '.docx':
-        # Handle .docx files using python-docx
-        doc = docx.Document(path)
-        full_text = []
-        for para in doc.paragraphs:
-            full_text.append(para.text)
-        return '\n'.join(full_text)
+        # Handle .docx files by reading their XML directly, imported here so
+        # text-only and --help runs don't pay for it
+        from docx_text import docx_paragraphs
+        return '\n'.join(docx_paragraphs(path))
     else:
         # Handle text files and other formats
         return path.read_text()
 
+def content_digest(text: str) -> str:
+    """Return the SHA-256 hex digest of a document's text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+# Analyses keyed by (document kind, content digest), most recently used last
+_ANALYSIS_CACHE_SIZE = 32
+_analysis_cache: "OrderedDict[tuple[str, str], BaseModel]" = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+def _get_cached_analysis(key: tuple[str, str]) -> Optional[BaseModel]:
+    with _analysis_cache_lock:
+        analysis = _analysis_cache.get(key)
+        if analysis is not None:
+            _analysis_cache.move_to_end(key)
+        return analysis
+
+def _cache_analysis(key: tuple[str, str], analysis: BaseModel) -> None:
+    with _analysis_cache_lock:
+        _analysis_cache[key] = analysis
+        _analysis_cache.move_to_end(key)
+        while len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
+
+# Structured LLM responses (the analyses), and the condensed resume text that
+# feeds a resume analysis, persisted across runs, keyed by model settings and
+# the fully rendered prompt. Free-text generations such as cover letters are
+# never cached, so each run still gets a fresh draft. Disabled
+# with the CLI's --no-cache flag, or for the rest of the process if the cache
+# file cannot be used.
+_LLM_CACHE_PATH = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "ai-resume-tools" / "llm.sqlite3"
+_llm_cache_enabled = True
+
+def set_llm_cache_enabled(enabled: bool) -> None:
+    """Turn the on-disk LLM response cache on or off for this process."""
+    global _llm_cache_enabled
+    _llm_cache_enabled = enabled
+
+def _open_llm_cache() -> sqlite3.Connection:
+    _LLM_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(_LLM_CACHE_PATH, timeout=10)
+    conn.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, content TEXT NOT NULL)")
+    return conn
+
+def _disable_llm_cache(error: Exception) -> None:
+    print(f"LLM response cache disabled: {error}")
+    set_llm_cache_enabled(False)
+
+def _read_cached_response(key: str) -> Optional[str]:
+    try:
+        with closing(_open_llm_cache()) as conn:
+            row = conn.execute("SELECT content FROM responses WHERE key = ?", (key,)).fetchone()
+    except (sqlite3.Error, OSError) as e:
+        _disable_llm_cache(e)
+        return None
+    return row[0] if row is not None else None
+
+def _store_cached_response(key: str, content: str) -> None:
+    try:
+        with closing(_open_llm_cache()) as conn, conn:
+            conn.execute("INSERT OR REPLACE INTO responses (key, content) VALUES (?, ?)", (key, content))
+    except (sqlite3.Error, OSError) as e:
+        _disable_llm_cache(e)
+
+def _llm_cache_key(model, prompt, inputs: Dict[str, Any], schema: Optional[type[BaseModel]] = None) -> str:
+    key_material = {
+        "model": model.model_name,
+        "temperature": model.temperature,
+        "schema": _schema_fingerprint(schema) if schema is not None else None,
+        "prompt": prompt.format(**inputs),
+    }
+    return hashlib.sha256(json.dumps(key_material, sort_keys=True).encode("utf-8")).hexdigest()
+
+@functools.lru_cache(maxsize=None)
+def _structured_llm(schema: type[BaseModel]):
+    # Plain function calling rather than strict json_schema, which rejects the
+    # free-form Dict[str, Any] fields in the analysis models
+    return llm.with_structured_output(schema, method="function_calling")
+
+@functools.lru_cache(maxsize=None)
+def _schema_fingerprint(schema: type[BaseModel]) -> str:
+    return json.dumps(schema.model_json_schema(), sort_keys=True)
+
+def _invoke_structured(prompt, inputs: Dict[str, Any], schema: type[BaseModel]) -> BaseModel:
+    result = (prompt | _structured_llm(schema)).invoke(inputs)
+    # Function calling yields None when the model answers in prose instead
+    # of calling the tool; report it like any other unparsable response
+    if result is None:
+        raise OutputParserException(f"Model did not return a {schema.__name__}")
+    return result
+
+def cached_invoke(prompt, inputs: Dict[str, Any], schema: Optional[type[BaseModel]] = None,
+                  on_chunk: Optional[Callable[[str], Any]] = None) -> Any:
+    """
+    Run prompt | llm on inputs and return the response text, or an instance
+    of schema when one is given.
+    
+    With a schema the model is bound to OpenAI's structured output, so it
+    returns validated fields instead of free text that has to be parsed.
+    Those responses are stored in a SQLite file in the user cache directory,
+    keyed by a SHA-256 of the model name, temperature, schema and rendered
+    prompt, so repeating an analysis with identical inputs skips the API call.
+    Text responses are always generated fresh, and streamed to on_chunk as
+    they arrive when it is given.
+    """
+    if schema is None:
+        chain = prompt | llm | StrOutputParser()
+        if on_chunk is None:
+            return chain.invoke(inputs)
+        chunks = []
+        for chunk in chain.stream(inputs):
+            on_chunk(chunk)
+            chunks.append(chunk)
+        return "".join(chunks)
+    
+    if not _llm_cache_enabled:
+        return _invoke_structured(prompt, inputs, schema)
+    
+    key = _llm_cache_key(llm, prompt, inputs, schema)
+    cached = _read_cached_response(key)
+    if cached is not None:
+        try:
+            return schema.model_validate_json(cached)
+        except ValidationError:
+            pass  # written by an older model definition; fetch a fresh one
+    
+    result = _invoke_structured(prompt, inputs, schema)
+    if _llm_cache_enabled:  # the lookup may have just disabled it
+        _store_cached_response(key, result.model_dump_json())
+    return result
+
 def analyze_resume(resume_text: str) -> ResumeAnalysis:
-    """Analyze a resume and extract structured information."""
-    resume_parser = PydanticOutputParser(pydantic_object=ResumeAnalysis)
+    """
+    Analyze a resume and extract structured information.
     
-    resume_prompt = PromptTemplate(
-        template="Analyze the following resume and extract key information:\n\n{resume}\n\n{format_instructions}",
-        input_variables=["resume"],
-        partial_variables={"format_instructions": resume_parser.get_format_instructions()},
-    )
+    Results are cached by content hash, so re-analyzing an identical resume
+    is a lookup instead of another LLM call.
+    """
+    key = ("resume", content_digest(resume_text))
+    analysis = _get_cached_analysis(key)
+    if analysis is None:
+        analysis = _analyze_resume_uncached(resume_text)
+        _cache_analysis(key, analysis)
+    return analysis
+
+# Token budget for a document in a single analysis prompt. Longer resumes
+# are condensed before analysis (disabled with the CLI's --full flag), and a
+# document over it is never fused with another into one prompt.
+_DIGEST_THRESHOLD_TOKENS = 6000
+_digest_long_resumes = True
+
+def set_resume_digest_enabled(enabled: bool) -> None:
+    """Turn condensing of long resumes before analysis on or off for this process."""
+    global _digest_long_resumes
+    _digest_long_resumes = enabled
+
+@functools.lru_cache(maxsize=4)
+def _token_encoding(model_name: str):
+    import tiktoken
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+# Memoized because analyze_documents and the digest check measure the same
+# documents back to back
+@functools.lru_cache(maxsize=8)
+def _count_tokens(model_name: str, text: str) -> int:
+    return len(_token_encoding(model_name).encode(text, disallowed_special=()))
+
+def count_tokens(text: str) -> int:
+    """Return the number of tokens text takes up for the current model."""
+    return _count_tokens(llm.model_name, text)
+
+def _digest_resume(resume_text: str) -> str:
+    # The digest is the analysis prompt's input, so it is kept on disk like
+    # the analyses: a fresh digest would render a new prompt and miss the
+    # cached analysis on every run
+    inputs = {"resume": resume_text}
+    key = _llm_cache_key(_digest_llm, _RESUME_DIGEST_PROMPT, inputs)
+    if _llm_cache_enabled:
+        cached = _read_cached_response(key)
+        if cached is not None:
+            return cached
     
-    chain = resume_prompt | llm
-    result = chain.invoke({"resume": resume_text})
+    digest = (_RESUME_DIGEST_PROMPT | _digest_llm | StrOutputParser()).invoke(inputs)
+    if _llm_cache_enabled:
+        _store_cached_response(key, digest)
+    return digest
+
+def _analyze_resume_uncached(resume_text: str) -> ResumeAnalysis:
+    if _digest_long_resumes and count_tokens(resume_text) > _DIGEST_THRESHOLD_TOKENS:
+        print("Condensing long resume before analysis...")
+        resume_text = _digest_resume(resume_text)
     
     try:
-        # Check if result is an AIMessage object and extract content if needed
-        from langchain_core.messages import AIMessage
-        if isinstance(result, AIMessage):
-            # Extract the content from AIMessage
-            result_text = result.content
-        else:
-            result_text = result
-            
-        return resume_parser.parse(result_text)
-    except Exception as e:
+        return cached_invoke(_RESUME_ANALYSIS_PROMPT, {"resume": resume_text}, ResumeAnalysis)
+    except (OutputParserException, ValidationError) as e:
         print(f"Error parsing resume analysis: {e}")
-        print("Raw output:", result)
         raise
 
 def analyze_job_description(job_text: str) -> JobAnalysis:
-    """Analyze a job description and extract structured information."""
-    job_parser = PydanticOutputParser(pydantic_object=JobAnalysis)
-    
-    job_prompt = PromptTemplate(
-        template="Analyze the following job description and extract key information:\n\n{job}\n\n{format_instructions}",
-        input_variables=["job"],
-        partial_variables={"format_instructions": job_parser.get_format_instructions()},
-    )
-    
-    chain = job_prompt | llm
-    result = chain.invoke({"job": job_text})
+    """
+    Analyze a job description and extract structured information.
     
+    Results are cached by content hash, like analyze_resume.
+    """
+    key = ("job", content_digest(job_text))
+    analysis = _get_cached_analysis(key)
+    if analysis is None:
+        analysis = _analyze_job_description_uncached(job_text)
+        _cache_analysis(key, analysis)
+    return analysis
+
+def _analyze_job_description_uncached(job_text: str) -> JobAnalysis:
     try:
-        # Check if result is an AIMessage object and extract content if needed
-        from langchain_core.messages import AIMessage
-        if isinstance(result, AIMessage):
-            # Extract the content from AIMessage
-            result_text = result.content
-        else:
-            result_text = result
-            
-        return job_parser.parse(result_text)
-    except Exception as e:
+        return cached_invoke(_JOB_ANALYSIS_PROMPT, {"job": job_text}, JobAnalysis)
+    except (OutputParserException, ValidationError) as e:
         print(f"Error parsing job analysis: {e}")
-        print("Raw output:", result)
         raise
 
-def customize_resume(resume_analysis: ResumeAnalysis, job_analysis: JobAnalysis) -> ResumeCustomization:
-    """Generate resume customization suggestions based on job description."""
-    customization_parser = PydanticOutputParser(pydantic_object=ResumeCustomization)
+def analyze_pair(resume_text: str, job_text: str) -> tuple[ResumeAnalysis, JobAnalysis]:
+    """
+    Analyze a resume and a job description with a single LLM call.
     
-    customization_prompt = PromptTemplate(
-        template="""Given a resume analysis and job description analysis, suggest ways to customize the resume:
-        
-Resume Analysis:
-{resume_analysis}
-
-Job Analysis:
-{job_analysis}
+    Args:
+        resume_text: Text of the resume
+        job_text: Text of the job description
+    
+    Returns:
+        Tuple of (ResumeAnalysis, JobAnalysis)
+    """
+    try:
+        combined = cached_invoke(_PAIR_ANALYSIS_PROMPT, {"resume": resume_text, "job": job_text}, CombinedAnalysis)
+        return combined.resume, combined.job
+    except (OutputParserException, ValidationError) as e:
+        print(f"Error parsing combined analysis: {e}")
+        raise
 
-{format_instructions}
-        """,
-        input_variables=["resume_analysis", "job_analysis"],
-        partial_variables={"format_instructions": customization_parser.get_format_instructions()},
-    )
+def analyze_documents(resume_text: str, job_text: str) -> tuple[ResumeAnalysis, JobAnalysis]:
+    """
+    Analyze a resume and a job description, reusing cached analyses.
     
-    chain = customization_prompt | llm
-    result = chain.invoke({"resume_analysis": resume_analysis.model_dump_json(), "job_analysis": job_analysis.model_dump_json()})
+    When neither document has been analyzed before, both are extracted with
+    one combined LLM call. If either document is too long to share a prompt
+    with the other, or the combined response cannot be parsed, the two
+    analyses run as separate calls issued in parallel.
+    """
+    resume_key = ("resume", content_digest(resume_text))
+    job_key = ("job", content_digest(job_text))
+    resume_analysis = _get_cached_analysis(resume_key)
+    job_analysis = _get_cached_analysis(job_key)
     
+    if resume_analysis is None and job_analysis is None:
+        # Long documents take the separate path, where a resume over the
+        # budget is condensed first (or analyzed in full with --full)
+        if max(count_tokens(resume_text), count_tokens(job_text)) <= _DIGEST_THRESHOLD_TOKENS:
+            try:
+                resume_analysis, job_analysis = analyze_pair(resume_text, job_text)
+            except (OutputParserException, ValidationError):
+                print("Retrying as separate analyses...")
+        if resume_analysis is None:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                resume_future = executor.submit(analyze_resume, resume_text)
+                job_future = executor.submit(analyze_job_description, job_text)
+                return resume_future.result(), job_future.result()
+        _cache_analysis(resume_key, resume_analysis)
+        _cache_analysis(job_key, job_analysis)
+    elif resume_analysis is None:
+        resume_analysis = analyze_resume(resume_text)
+    elif job_analysis is None:
+        job_analysis = analyze_job_description(job_text)
+    
+    return resume_analysis, job_analysis
+
+def customize_resume(resume_analysis: ResumeAnalysis, job_analysis: JobAnalysis) -> ResumeCustomization:
+    """Generate resume customization suggestions based on job description."""
     try:
-        # Check if result is an AIMessage object and extract content if needed
-        from langchain_core.messages import AIMessage
-        if isinstance(result, AIMessage):
-            # Extract the content from AIMessage
-            result_text = result.content
-        else:
-            result_text = result
-            
-        return customization_parser.parse(result_text)
-    except Exception as e:
+        return cached_invoke(_CUSTOMIZATION_PROMPT, {
+            "resume_analysis": resume_analysis.prompt_json,
+            "job_analysis": job_analysis.prompt_json
+        }, ResumeCustomization)
+    except (OutputParserException, ValidationError) as e:
         print(f"Error parsing customization suggestions: {e}")
-        print("Raw output:", result)
         raise
 
 def generate_cover_letter(resume_analysis: ResumeAnalysis, job_analysis: JobAnalysis, 
-                         candidate_name: str, company_name: str) -> str:
-    """Generate a cover letter based on resume and job description analysis."""
-    cover_letter_prompt = ChatPromptTemplate.from_template("""
-You are a professional cover letter writer. Create a compelling cover letter for {candidate_name} applying to {company_name}.
-The cover letter should be professional, engaging, and tailored to the specific job.
+                         candidate_name: str, company_name: str,
+                         on_chunk: Optional[Callable[[str], Any]] = None) -> str:
+    """
+    Generate a cover letter based on resume and job description analysis.
+    
+    If on_chunk is given it receives the text in pieces as it is generated.
+    """
+    return cached_invoke(_COVER_LETTER_PROMPT, {
+        "candidate_name": candidate_name,
+        "company_name": company_name,
+        "resume_info": resume_analysis.prompt_json,
+        "job_info": job_analysis.prompt_json
+    }, on_chunk=on_chunk)
 
-Resume Information:
-{resume_info}
+def generate_customized_resume(resume_text: str, customization: ResumeCustomization,
+                               on_chunk: Optional[Callable[[str], Any]] = None) -> str:
+    """
+    Generate a customized resume based on original resume and customization suggestions.
+    
+    If on_chunk is given it receives the text in pieces as it is generated.
+    """
+    return cached_invoke(_CUSTOMIZED_RESUME_PROMPT, {
+        "resume": resume_text,
+        "customization": customization.prompt_json
+    }, on_chunk=on_chunk)
 
-Job Information:
-{job_info}
+def generate_customized_resume_direct(resume_text: str, resume_analysis: ResumeAnalysis,
+                                     job_analysis: JobAnalysis,
+                                     on_chunk: Optional[Callable[[str], Any]] = None) -> str:
+    """
+    Generate a customized resume in one LLM call.
+    
+    The model works out the customization itself instead of receiving the
+    suggestions from customize_resume, saving one round trip. Use
+    customize_resume plus generate_customized_resume when the suggestions
+    should be shown. If on_chunk is given it receives the text in pieces as it
+    is generated.
+    """
+    return cached_invoke(_DIRECT_RESUME_PROMPT, {
+        "resume": resume_text,
+        "resume_analysis": resume_analysis.prompt_json,
+        "job_analysis": job_analysis.prompt_json
+    }, on_chunk=on_chunk)
 
-Important guidelines:
-1. Keep the length to one page (approximately 400 words)
-2. Address how the candidate's experience aligns with job requirements
-3. Highlight relevant skills and achievements
-4. Demonstrate understanding of the company values
-5. Include a strong opening and closing
-6. Use a professional, confident tone
-7. Format as a formal business letter
+def save_document(content: str, file_path: str) -> None:
+    """Save content to a file."""
+    path = Path(file_path)
+    path.write_bytes(content.encode("utf-8"))
+    print(f"Document saved to {file_path}")
 
-Create the full cover letter text now:
-""")
+_STREAM_BUFFER_SIZE = 1 << 20
+
+# Flags for a streamed document's temp file: created exclusively, so a name
+# collision is retried instead of clobbering another file, and binary on Windows
+_TEMP_FILE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+def _open_temp_beside(target: Path):
+    # Created with mode 0666 so the kernel applies the umask, giving the temp
+    # file the permissions a newly created target would have had
+    for _ in range(100):
+        temp_path = target.parent / f".{target.name}.{os.urandom(4).hex()}.tmp"
+        try:
+            fd = os.open(temp_path, _TEMP_FILE_FLAGS, 0o666)
+        except FileExistsError:
+            continue
+        return temp_path, os.fdopen(fd, "wb", buffering=_STREAM_BUFFER_SIZE)
+    raise FileExistsError(f"Could not create a temporary file next to {target}")
+
+def stream_document(generate: Callable[..., str], file_path: str) -> str:
+    """
+    Run a generate_* function, writing its output to file_path as it streams.
     
-    chain = cover_letter_prompt | llm
+    Output goes to a temporary file next to file_path that replaces it only
+    once generation finishes, so a failed or interrupted run leaves any
+    existing document at file_path untouched.
     
-    result = chain.invoke({
-        "candidate_name": candidate_name,
-        "company_name": company_name,
-        "resume_info": resume_analysis.model_dump_json(),
-        "job_info": job_analysis.model_dump_json()
-    })
-    
-    # Check if result is an AIMessage object and extract content if needed
-    from langchain_core.messages import AIMessage
-    if isinstance(result, AIMessage):
-        # Extract the content from AIMessage
-        return result.content
-    else:
-        return result
-
-def generate_customized_resume(resume_text: str, customization: ResumeCustomization) -> str:
-    """Generate a customized resume based on original resume and customization suggestions."""
-    resume_prompt = ChatPromptTemplate.from_template("""
-You are a professional resume writer. Create a customized version of the following resume based on the customization suggestions.
-Keep the same general format, but implement the suggested changes to better target the specific job opportunity.
+    Args:
+        generate: Generator function (with its other arguments bound) that
+            accepts an on_chunk keyword argument
+        file_path: Path to save the document to
+    
+    Returns:
+        The full generated text
+    """
+    target = Path(file_path)
+    # Chunks are small, so buffer them and write the file in large blocks
+    temp_path, tmp = _open_temp_beside(target)
+    try:
+        with tmp:
+            content = generate(on_chunk=lambda chunk: tmp.write(chunk.encode("utf-8")))
+        # Replacing an existing document keeps its permissions
+        if target.exists():
+            os.chmod(temp_path, target.stat().st_mode & 0o7777)
+        os.replace(temp_path, target)
+    except BaseException:
+        # Includes KeyboardInterrupt, so Ctrl-C does not leave temp files behind
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    print(f"Document saved to {file_path}")
+    return content
 
-Original Resume:
-{resume}
+def _bulk_cover_letter(pair: Dict[str, Any], base_dir: Path, output_path: Path) -> Dict[str, Any]:
+    try:
+        resume_text = load_document(str(base_dir / pair["resume"]))
+        job_text = load_document(str(base_dir / pair["job"]))
+        resume_analysis, job_analysis = analyze_documents(resume_text, job_text)
+        stream_document(functools.partial(generate_cover_letter, resume_analysis, job_analysis,
+                                          pair["name"], pair["company"]),
+                        str(output_path))
+        return {"ok": True, "path": str(output_path), "message": f"Saved to {output_path}"}
+    except Exception as e:
+        return {"ok": False, "path": None, "message": f"Error generating cover letter: {str(e)}"}
 
-Customization Suggestions:
-{customization}
+# Keys every line of a bulk pairs file must provide
+_BULK_PAIR_KEYS = ("resume", "job", "name", "company")
 
-Important guidelines:
-1. Highlight the skills that match the job requirements
-2. Emphasize relevant experience aspects
-3. Add suggested content where appropriate
-4. Remove or de-emphasize less relevant content
-5. Keep professional formatting
-6. Maintain approximately the same length as the original
+def bulk_cover_letters(pairs_path: str, out_dir: str, max_concurrency: int = 8) -> list[Dict[str, Any]]:
+    """
+    Generate one cover letter per line of a JSON Lines file, several at a time.
+    
+    Each line is an object with "resume", "job", "name" and "company" keys and
+    an optional "output" file name. Relative document paths are resolved
+    against the pairs file's directory. Pairs run concurrently on a thread
+    pool, so their API calls overlap instead of queuing behind each other.
+    
+    A line that is not valid JSON, lacks one of the required keys, or whose
+    "output" would land outside out_dir or on the same file as another
+    pair's, fails without being run.
+    
+    Args:
+        pairs_path: Path to the JSON Lines file of pairs
+        out_dir: Directory to write the cover letters to
+        max_concurrency: Maximum number of pairs processed at once
+    
+    Returns:
+        List of dicts with "ok", "path" and "message", one per pair, in input order
+    """
+    base_dir = Path(pairs_path).resolve().parent
+    with open(pairs_path) as f:
+        lines = [line for line in f if line.strip()]
+    
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    out_root = out.resolve()
+    
+    # A bad line fails only its own pair; the rest of the run goes ahead
+    results: list[Optional[Dict[str, Any]]] = [None] * len(lines)
+    pairs: Dict[int, Dict[str, Any]] = {}
+    output_paths: Dict[int, Path] = {}
+    for i, line in enumerate(lines):
+        try:
+            try:
+                pair = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"invalid JSON ({e})") from e
+            if not isinstance(pair, dict):
+                raise ValueError("expected a JSON object")
+            invalid = [key for key in _BULK_PAIR_KEYS if not isinstance(pair.get(key), str) or not pair[key].strip()]
+            if invalid:
+                raise ValueError(", ".join(f'"{key}"' for key in invalid) + " must be non-empty strings")
+            name = pair.get("output", f"cover_letter_{i + 1:03d}.txt")
+            if not isinstance(name, str):
+                raise ValueError('"output" must be a file name')
+            output_path = (out / name).resolve()
+            if output_path == out_root or not output_path.is_relative_to(out_root):
+                raise ValueError(f'"output" must stay inside {out}: {name}')
+        except ValueError as e:
+            results[i] = {"ok": False, "path": None, "message": f"Pair {i + 1}: {e}"}
+        else:
+            pairs[i] = pair
+            output_paths[i] = output_path
+    
+    # Pairs writing to the same file would overwrite each other, so none of them run
+    claimed: Dict[Path, list[int]] = {}
+    for i, output_path in output_paths.items():
+        claimed.setdefault(output_path, []).append(i)
+    for output_path, indices in claimed.items():
+        if len(indices) > 1:
+            for i in indices:
+                del pairs[i]
+                results[i] = {"ok": False, "path": None,
+                              "message": f"Pair {i + 1}: output {output_path} is shared with other pairs"}
+    
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        for i, result in zip(pairs, executor.map(_bulk_cover_letter, pairs.values(),
+                                                 [base_dir] * len(pairs),
+                                                 [output_paths[i] for i in pairs])):
+            results[i] = result
+    return results
 
-Create the full customized resume now:
-""")
+def warmup() -> None:
+    """
+    Pre-load dependencies that are otherwise initialized on first use.
     
-    chain = resume_prompt | llm
+    Meant to be called from a background thread at GUI startup so the first
+    task does not pay for this setup.
+    """
+    import docx_text  # imported lazily by load_document
+    _token_encoding(llm.model_name)  # loads tiktoken's encoding tables
     
-    return chain.invoke({
-        "resume": resume_text,
-        "customization": customization.model_dump_json()
-    })
+    # Binding a schema converts it to an OpenAI tool definition
+    for schema in (ResumeAnalysis, JobAnalysis, CombinedAnalysis, ResumeCustomization, JobMatch):
+        _structured_llm(schema)
 
-def save_document(content: str, file_path: str) -> None:
-    """Save content to a file."""
-    path = Path(file_path)
-    path.write_text(content)
-    print(f"Document saved to {file_path}")
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a whole number, got {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
 
 def main():
     parser = argparse.ArgumentParser(description="AI Resume Tools - Generate cover letters and customize resumes")
+    parser.add_argument("--no-cache", action="store_true", help="Always call the API instead of reusing cached analyses")
+    parser.add_argument("--full", action="store_true",
+                        help="Analyze long resumes in full instead of condensing them first")
+    parser.add_argument("--model", help=f"OpenAI model to use (default: {MODEL}, from OPENAI_MODEL if set)")
     subparsers = parser.add_subparsers(dest="command", help="Commands")
     
     # Cover letter generation command
@@ -279,6 +792,15 @@ def main():
     resume_parser.add_argument("--resume", required=True, help="Path to resume file")
     resume_parser.add_argument("--job", required=True, help="Path to job description file")
     resume_parser.add_argument("--output", default="customized_resume.txt", help="Output file path")
+    resume_parser.add_argument("--explain", action="store_true",
+                               help="Generate and print customization suggestions before rewriting the resume")
+    
+    # Bulk cover letter command
+    bulk_parser = subparsers.add_parser("bulk-cover-letter", help="Generate cover letters for many resume/job pairs")
+    bulk_parser.add_argument("--pairs", required=True,
+                             help="JSON Lines file with resume, job, name, company and optional output per line")
+    bulk_parser.add_argument("--out-dir", default="cover_letters", help="Directory for the generated cover letters")
+    bulk_parser.add_argument("--max-concurrency", type=_positive_int, default=8, help="Maximum pairs processed at once")
     
     # Analyze command
     analyze_parser = subparsers.add_parser("analyze", help="Analyze a resume or job description")
@@ -287,6 +809,12 @@ def main():
     analyze_parser.add_argument("--output", help="Output JSON file path")
     
     args = parser.parse_args()
+    if args.no_cache:
+        set_llm_cache_enabled(False)
+    if args.model:
+        set_model(args.model)
+    if args.full:
+        set_resume_digest_enabled(False)
     
     if args.command == "cover-letter":
         # Load documents
@@ -294,22 +822,19 @@ def main():
         job_text = load_document(args.job)
         
         # Analyze documents
-        print("Analyzing resume...")
-        resume_analysis = analyze_resume(resume_text)
-        print("Analyzing job description...")
-        job_analysis = analyze_job_description(job_text)
+        print("Analyzing resume and job description...")
+        resume_analysis, job_analysis = analyze_documents(resume_text, job_text)
         
-        # Generate cover letter
+        # Generate the cover letter, streaming it to the output file, or to
+        # the terminal when no output path was given
         print("Generating cover letter...")
-        cover_letter = generate_cover_letter(
-            resume_analysis, 
-            job_analysis, 
-            args.name, 
-            args.company
-        )
-        
-        # Save the cover letter
-        save_document(cover_letter, args.output)
+        generate = functools.partial(generate_cover_letter, resume_analysis, job_analysis,
+                                     args.name, args.company)
+        if args.output:
+            stream_document(generate, args.output)
+        else:
+            generate(on_chunk=sys.stdout.write)
+            print()
         
     elif args.command == "customize-resume":
         # Load documents
@@ -317,21 +842,30 @@ def main():
         job_text = load_document(args.job)
         
         # Analyze documents
-        print("Analyzing resume...")
-        resume_analysis = analyze_resume(resume_text)
-        print("Analyzing job description...")
-        job_analysis = analyze_job_description(job_text)
+        print("Analyzing resume and job description...")
+        resume_analysis, job_analysis = analyze_documents(resume_text, job_text)
         
-        # Generate customization suggestions
-        print("Generating customization suggestions...")
-        customization = customize_resume(resume_analysis, job_analysis)
+        if args.explain:
+            # Generate customization suggestions
+            print("Generating customization suggestions...")
+            customization = customize_resume(resume_analysis, job_analysis)
+            print(customization.model_dump_json(indent=2))
+            
+            generate = functools.partial(generate_customized_resume, resume_text, customization)
+        else:
+            generate = functools.partial(generate_customized_resume_direct, resume_text,
+                                         resume_analysis, job_analysis)
         
-        # Generate customized resume
+        # Generate the customized resume, streaming it to the output file
         print("Customizing resume...")
-        customized_resume = generate_customized_resume(resume_text, customization)
+        stream_document(generate, args.output)
         
-        # Save the customized resume
-        save_document(customized_resume, args.output)
+    elif args.command == "bulk-cover-letter":
+        print("Generating cover letters...")
+        results = bulk_cover_letters(args.pairs, args.out_dir, args.max_concurrency)
+        for result in results:
+            print(result["message"])
+        print(f"{sum(result['ok'] for result in results)} of {len(results)} cover letters generated")
         
     elif args.command == "analyze":
         if args.type == "resume":
@@ -360,34 +894,39 @@ def main():
         parser.print_help()
 
 # Wrapper functions for GUI integration
-def analyze_document(file_path: str, doc_type: str) -> str:
+def analyze_document(file_path: Optional[str], doc_type: str, job_desc_content: Optional[str] = None) -> str:
     """
     Analyze a document and return the analysis as a formatted string.
     
     Args:
         file_path: Path to the document file
         doc_type: Type of document ('resume' or 'job')
+        job_desc_content: Job description text to analyze instead of reading file_path
     
     Returns:
         Formatted string with analysis results
     """
     try:
-        text = load_document(file_path)
+        if doc_type.lower() == "job" and job_desc_content:
+            text = job_desc_content
+        else:
+            text = load_document(file_path)
         
         if doc_type.lower() == "resume":
             print("Analyzing resume...")
             analysis = analyze_resume(text)
-            return json.dumps(json.loads(analysis.model_dump_json()), indent=2)
+            return analysis.model_dump_json(indent=2)
         elif doc_type.lower() == "job":
             print("Analyzing job description...")
             analysis = analyze_job_description(text)
-            return json.dumps(json.loads(analysis.model_dump_json()), indent=2)
+            return analysis.model_dump_json(indent=2)
         else:
             return f"Error: Invalid document type '{doc_type}'. Must be 'resume' or 'job'."
     except Exception as e:
         return f"Error analyzing document: {str(e)}"
 
-def process_resume_customization(resume_path: str, job_path: str, output_path: str) -> str:
+def process_resume_customization(resume_path: str, job_path: Optional[str], output_path: str,
+                                 job_desc_content: Optional[str] = None) -> Dict[str, Any]:
     """
     Load documents, analyze them, and generate a customized resume.
     
@@ -395,37 +934,41 @@ def process_resume_customization(resume_path: str, job_path: str, output_path: s
         resume_path: Path to the resume file
         job_path: Path to the job description file
         output_path: Path to save the customized resume
+        job_desc_content: Job description text to use instead of reading job_path
     
     Returns:
-        Status message
+        Dict with "ok" (bool), "path" (output path or None) and a
+        human-readable "message"
     """
     try:
         # Load documents
         resume_text = load_document(resume_path)
-        job_text = load_document(job_path)
+        job_text = job_desc_content or load_document(job_path)
         
         # Analyze documents
-        print("Analyzing resume...")
-        resume_analysis = analyze_resume(resume_text)
-        print("Analyzing job description...")
-        job_analysis = analyze_job_description(job_text)
+        print("Analyzing resume and job description...")
+        resume_analysis, job_analysis = analyze_documents(resume_text, job_text)
         
-        # Generate customization suggestions
-        print("Generating customization suggestions...")
-        customization = customize_resume(resume_analysis, job_analysis)
-        
-        # Generate customized resume
+        # Generate the customized resume, streaming it to the output file
         print("Customizing resume...")
-        customized_resume = generate_customized_resume(resume_text, customization)
-        
-        # Save the customized resume
-        save_document(customized_resume, output_path)
+        stream_document(functools.partial(generate_customized_resume_direct, resume_text,
+                                          resume_analysis, job_analysis),
+                        output_path)
         
-        return f"Successfully customized resume and saved to {output_path}"
+        return {
+            "ok": True,
+            "path": output_path,
+            "message": f"Successfully customized resume and saved to {output_path}",
+        }
     except Exception as e:
-        return f"Error customizing resume: {str(e)}"
+        return {
+            "ok": False,
+            "path": None,
+            "message": f"Error customizing resume: {str(e)}",
+        }
 
-def process_cover_letter(resume_path: str, job_path: str, name: str, company: str, output_path: Optional[str] = None) -> str:
+def process_cover_letter(resume_path: str, job_path: Optional[str], name: str, company: str,
+                         output_path: Optional[str] = None, job_desc_content: Optional[str] = None) -> Dict[str, Any]:
     """
     Load documents, analyze them, and generate a cover letter.
     
@@ -435,33 +978,34 @@ def process_cover_letter(resume_path: str, job_path: str, name: str, company: st
         name: Candidate's name
         company: Company name
         output_path: Path to save the cover letter, if None or empty a file dialog will be shown
+        job_desc_content: Job description text to use instead of reading job_path
     
     Returns:
-        Status message
+        Dict with "ok" (bool), "path" (output path or None), "canceled" (bool)
+        and a human-readable "message"
     """
     try:
         # Load documents
         resume_text = load_document(resume_path)
-        job_text = load_document(job_path)
+        job_text = job_desc_content or load_document(job_path)
         
         # Analyze documents
-        print("Analyzing resume...")
-        resume_analysis = analyze_resume(resume_text)
-        print("Analyzing job description...")
-        job_analysis = analyze_job_description(job_text)
+        print("Analyzing resume and job description...")
+        resume_analysis, job_analysis = analyze_documents(resume_text, job_text)
         
         # Generate cover letter
         print("Generating cover letter...")
-        cover_letter = generate_cover_letter(
-            resume_analysis, 
-            job_analysis, 
-            name, 
-            company
-        )
-        
-        # If output_path is None or empty, prompt user for save location
-        if not output_path:
+        generate = functools.partial(generate_cover_letter, resume_analysis, job_analysis, name, company)
+        if output_path:
+            # Stream the letter straight into the known output file
+            stream_document(generate, output_path)
+        else:
+            cover_letter = generate()
+            
+            # Output path is None or empty, prompt user for save location.
             # Create a root window and hide it
+            import tkinter as tk
+            from tkinter import filedialog
             root = tk.Tk()
             root.withdraw()
             
@@ -474,14 +1018,29 @@ def process_cover_letter(resume_path: str, job_path: str, name: str, company: st
             
             # If user cancels the dialog
             if not output_path:
-                return "Error: Cover letter generation canceled. No output location selected."
-        
-        # Save the cover letter
-        save_document(cover_letter, output_path)
+                return {
+                    "ok": False,
+                    "path": None,
+                    "canceled": True,
+                    "message": "Error: Cover letter generation canceled. No output location selected.",
+                }
+            
+            # Save the cover letter
+            save_document(cover_letter, output_path)
         
-        return f"Successfully generated cover letter and saved to {output_path}"
+        return {
+            "ok": True,
+            "path": output_path,
+            "canceled": False,
+            "message": f"Successfully generated cover letter and saved to {output_path}",
+        }
     except Exception as e:
-        return f"Error generating cover letter: {str(e)}"
+        return {
+            "ok": False,
+            "path": None,
+            "canceled": False,
+            "message": f"Error generating cover letter: {str(e)}",
+        }
 
 def compare_resume_to_job(resume_path: str, job_description_path: str) -> JobMatch:
     """
@@ -494,75 +1053,51 @@ def compare_resume_to_job(resume_path: str, job_description_path: str) -> JobMat
     Returns:
         JobMatch object with detailed analysis
     """
-    # Load and analyze the resume
     resume_text = load_document(resume_path)
-    resume_analysis = analyze_resume(resume_text)
-    
-    # Load and analyze the job description
     job_text = load_document(job_description_path)
-    job_analysis = analyze_job_description(job_text)
-    
-    # Create a parser for the JobMatch output
-    job_match_parser = PydanticOutputParser(pydantic_object=JobMatch)
-    
-    # Create a prompt template for the comparison
-    match_prompt = PromptTemplate(
-        template="""
-Analyze how well the resume matches the job description and provide a detailed assessment:
-
-Resume Analysis:
-{resume_analysis}
+    return compare_resume_to_job_text(resume_text, job_text)
 
-Job Description Analysis:
-{job_analysis}
-
-Provide a detailed assessment of how well the candidate's profile matches this job opportunity.
-Be objective and analytical, assessing both strengths and weaknesses. 
-Consider skills match, experience alignment, and overall fit.
-
-{format_instructions}
-""",
-        input_variables=["resume_analysis", "job_analysis"],
-        partial_variables={"format_instructions": job_match_parser.get_format_instructions()},
-    )
+def compare_resume_to_job_text(resume_text: str, job_text: str) -> JobMatch:
+    """
+    Compare already-loaded resume and job description text.
     
-    # Create and run the chain
-    chain = match_prompt | llm
-    result = chain.invoke({
-        "resume_analysis": resume_analysis.model_dump_json(),
-        "job_analysis": job_analysis.model_dump_json()
-    })
+    Args:
+        resume_text: Text of the resume
+        job_text: Text of the job description
+    
+    Returns:
+        JobMatch object with detailed analysis
+    """
+    # Analyze both documents in parallel
+    resume_analysis, job_analysis = analyze_documents(resume_text, job_text)
     
     try:
-        # Check if result is an AIMessage object and extract content if needed
-        from langchain_core.messages import AIMessage
-        if isinstance(result, AIMessage):
-            # Extract the content from AIMessage
-            result_text = result.content
-        else:
-            result_text = result
-            
-        return job_match_parser.parse(result_text)
-    except Exception as e:
+        return cached_invoke(_MATCH_PROMPT, {
+            "resume_analysis": resume_analysis.prompt_json,
+            "job_analysis": job_analysis.prompt_json
+        }, JobMatch)
+    except (OutputParserException, ValidationError) as e:
         print(f"Error parsing job match analysis: {e}")
-        print("Raw output:", result)
         raise
 
-def process_job_match(resume_path: str, job_path: str) -> str:
+def process_job_match(resume_path: str, job_path: Optional[str], job_desc_content: Optional[str] = None) -> str:
     """
     Compare a resume to a job description and return a detailed match analysis.
     
     Args:
         resume_path: Path to the resume file
         job_path: Path to the job description file
+        job_desc_content: Job description text to use instead of reading job_path
     
     Returns:
         Formatted string with match analysis results
     """
     try:
         print("Analyzing job match...")
-        match_analysis = compare_resume_to_job(resume_path, job_path)
-        return json.dumps(json.loads(match_analysis.model_dump_json()), indent=2)
+        resume_text = load_document(resume_path)
+        job_text = job_desc_content or load_document(job_path)
+        match_analysis = compare_resume_to_job_text(resume_text, job_text)
+        return match_analysis.model_dump_json(indent=2)
     except Exception as e:
         return f"Error analyzing job match: {str(e)}"
 
@@ -0,0 +1,75 @@
+import pytest
+
+docx = pytest.importorskip("docx", minversion="1.0")  # hyperlink text in Paragraph.text
+from docx.enum.text import WD_BREAK
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+
+from docx_text import docx_paragraphs
+
+
+def _add_hyperlink(paragraph, text):
+    hyperlink = OxmlElement("w:hyperlink")
+    run = OxmlElement("w:r")
+    t = OxmlElement("w:t")
+    t.text = text
+    run.append(t)
+    hyperlink.append(run)
+    paragraph._p.append(hyperlink)
+
+
+@pytest.fixture
+def resume_docx(tmp_path):
+    document = docx.Document()
+    
+    # Soft return (Shift+Enter) between title and employer
+    title = document.add_paragraph()
+    title.add_run("Senior Engineer").add_break()
+    title.add_run("Acme Corp")
+    
+    # Page and column breaks add no text in python-docx
+    page = document.add_paragraph("Before page")
+    page.add_run().add_break(WD_BREAK.PAGE)
+    page.add_run("after page")
+    
+    # Carriage return, non-breaking hyphen and tab inside runs
+    misc = document.add_paragraph()
+    run = misc.add_run("Line one")
+    run._r.append(OxmlElement("w:cr"))
+    run._r.append(OxmlElement("w:t"))
+    run._r[-1].text = "e"
+    run._r.append(OxmlElement("w:noBreakHyphen"))
+    run._r.append(OxmlElement("w:t"))
+    run._r[-1].text = "mail\tsoon"
+    misc.add_run("\tTabbed")
+    
+    # Hyperlink runs between ordinary runs
+    links = document.add_paragraph("Portfolio: ")
+    _add_hyperlink(links, "example.com")
+    links.add_run(" (updated)")
+    
+    document.add_paragraph("")
+    
+    path = tmp_path / "resume.docx"
+    document.save(path)
+    return path
+
+
+def test_matches_python_docx(resume_docx):
+    expected = [p.text for p in docx.Document(resume_docx).paragraphs]
+    assert docx_paragraphs(resume_docx) == expected
+
+
+def test_soft_return_is_a_line_break(resume_docx):
+    assert docx_paragraphs(resume_docx)[0] == "Senior Engineer\nAcme Corp"
+
+
+def test_falls_back_to_python_docx_without_body(tmp_path, monkeypatch):
+    document = docx.Document()
+    document.add_paragraph("Only paragraph")
+    path = tmp_path / "plain.docx"
+    document.save(path)
+    
+    import docx_text
+    monkeypatch.setattr(docx_text, "_W_BODY", "{urn:missing}body")
+    assert docx_paragraphs(path) == ["Only paragraph"]
@@ -0,0 +1,148 @@
+import json
+import os
+
+import pytest
+
+pytest.importorskip("langchain_openai")
+# main exits at import without a key; no test here reaches the API
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+import main
+
+
+def _pair(**overrides):
+    pair = {"resume": "resume.txt", "job": "job.txt", "name": "Jane Doe", "company": "Acme"}
+    pair.update(overrides)
+    return json.dumps(pair)
+
+
+@pytest.fixture
+def generated(monkeypatch):
+    """Stub out per-pair generation, recording the output paths that would be written."""
+    written = []
+    
+    def fake_bulk_cover_letter(pair, base_dir, output_path):
+        written.append(output_path)
+        return {"ok": True, "path": str(output_path), "message": f"Saved to {output_path}"}
+    
+    monkeypatch.setattr(main, "_bulk_cover_letter", fake_bulk_cover_letter)
+    return written
+
+
+def test_bulk_bad_lines_fail_alone(tmp_path, generated):
+    pairs = tmp_path / "pairs.jsonl"
+    pairs.write_text("\n".join([
+        _pair(output="first.txt"),
+        "{not json",
+        _pair(output="../escaped.txt"),
+        json.dumps({"resume": "resume.txt", "job": "job.txt", "name": "Jane Doe"}),
+        _pair(output="last.txt"),
+    ]) + "\n")
+    out_dir = tmp_path / "letters"
+    
+    results = main.bulk_cover_letters(str(pairs), str(out_dir))
+    
+    assert [r["ok"] for r in results] == [True, False, False, False, True]
+    assert "invalid JSON" in results[1]["message"]
+    assert "must stay inside" in results[2]["message"]
+    assert '"company" must be non-empty strings' in results[3]["message"]
+    assert generated == [(out_dir / "first.txt").resolve(), (out_dir / "last.txt").resolve()]
+    assert not (tmp_path / "escaped.txt").exists()
+
+
+def test_bulk_duplicate_outputs_never_run(tmp_path, generated):
+    pairs = tmp_path / "pairs.jsonl"
+    pairs.write_text("\n".join([
+        _pair(output="same.txt"),
+        _pair(),
+        _pair(output="./same.txt"),
+    ]) + "\n")
+    
+    results = main.bulk_cover_letters(str(pairs), str(tmp_path / "letters"))
+    
+    assert [r["ok"] for r in results] == [False, True, False]
+    assert "shared with other pairs" in results[0]["message"]
+    assert len(generated) == 1
+
+
+def _write_chunks(*chunks):
+    def generate(on_chunk):
+        for chunk in chunks:
+            on_chunk(chunk)
+        return "".join(chunks)
+    return generate
+
+
+def _failing_generate(on_chunk):
+    on_chunk("partial draft")
+    raise RuntimeError("connection dropped")
+
+
+def test_stream_document_writes_output(tmp_path):
+    target = tmp_path / "letter.txt"
+    
+    assert main.stream_document(_write_chunks("Dear ", "Acme"), str(target)) == "Dear Acme"
+    assert target.read_text(encoding="utf-8") == "Dear Acme"
+    assert os.listdir(tmp_path) == ["letter.txt"]
+
+
+def test_stream_document_failure_keeps_existing_file(tmp_path):
+    target = tmp_path / "letter.txt"
+    target.write_text("previous letter")
+    
+    with pytest.raises(RuntimeError):
+        main.stream_document(_failing_generate, str(target))
+    
+    assert target.read_text() == "previous letter"
+    assert os.listdir(tmp_path) == ["letter.txt"]
+
+
+def test_stream_document_failure_leaves_no_temp_file(tmp_path):
+    with pytest.raises(RuntimeError):
+        main.stream_document(_failing_generate, str(tmp_path / "letter.txt"))
+    
+    assert os.listdir(tmp_path) == []
+
+
+_JOB = main.JobAnalysis(required_skills=["Python"], preferred_skills=[], responsibilities=[],
+                        company_values=[], keywords=[])
+
+
+@pytest.fixture
+def api_calls(monkeypatch):
+    """Replace structured LLM calls with a canned JobAnalysis, counting them."""
+    calls = []
+    
+    def fake_invoke_structured(prompt, inputs, schema):
+        calls.append(inputs)
+        return _JOB
+    
+    monkeypatch.setattr(main, "_invoke_structured", fake_invoke_structured)
+    monkeypatch.setattr(main, "_llm_cache_enabled", True)
+    return calls
+
+
+def test_cached_invoke_reuses_stored_analysis(tmp_path, monkeypatch, api_calls):
+    monkeypatch.setattr(main, "_LLM_CACHE_PATH", tmp_path / "llm.sqlite3")
+    
+    for _ in range(2):
+        assert main.cached_invoke(main._JOB_ANALYSIS_PROMPT, {"job": "Python developer"}, main.JobAnalysis) == _JOB
+    
+    assert len(api_calls) == 1
+
+
+@pytest.mark.parametrize("unusable", ["parent_is_file", "path_is_directory"])
+def test_cached_invoke_disables_unusable_cache(tmp_path, monkeypatch, api_calls, unusable):
+    if unusable == "parent_is_file":
+        (tmp_path / "cache").write_text("")
+        cache_path = tmp_path / "cache" / "llm.sqlite3"  # mkdir raises OSError
+    else:
+        cache_path = tmp_path / "llm.sqlite3"
+        cache_path.mkdir()  # sqlite3 cannot open a directory
+    monkeypatch.setattr(main, "_LLM_CACHE_PATH", cache_path)
+    
+    for _ in range(2):
+        assert main.cached_invoke(main._JOB_ANALYSIS_PROMPT, {"job": "Python developer"}, main.JobAnalysis) == _JOB
+    
+    assert len(api_calls) == 2
+    assert main._llm_cache_enabled is False
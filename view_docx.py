@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
-import docx
 from pathlib import Path
+from docx_text import docx_paragraphs
 
 def main():
     # Path to the DOCX file
@@ -8,7 +8,7 @@ def main():
     
     try:
         # Open the document
-        doc = docx.Document(file_path)
+        paragraphs = docx_paragraphs(file_path)
         
         print(f"Successfully opened: {file_path}\n")
         
@@ -16,12 +16,12 @@ def main():
         print("Document content:")
         print("-" * 50)
         
-        for i, paragraph in enumerate(doc.paragraphs, 1):
-            if paragraph.text.strip():  # Only print non-empty paragraphs
-                print(f"Paragraph {i}: {paragraph.text}")
+        for i, text in enumerate(paragraphs, 1):
+            if text.strip():  # Only print non-empty paragraphs
+                print(f"Paragraph {i}: {text}")
         
         print("-" * 50)
-        print(f"Total paragraphs: {len(doc.paragraphs)}")
+        print(f"Total paragraphs: {len(paragraphs)}")
         
     except Exception as e:
         print(f"Error opening the document: {e}")